@@ -6,7 +6,7 @@ from typing import Any, DefaultDict, Set, Tuple
 from numpy.random import Generator
 
 from core.models import DocumentPlanNode, Slot
-from core.pipeline import NLGPipelineComponent
+from core.pipeline import NLGPipelineComponent, normalize_language
 from core.registry import Registry
 
 log = logging.getLogger(__name__)
@@ -31,9 +31,7 @@ class EntityNameResolver(NLGPipelineComponent):
         """
         log.info("Running NER")
 
-        if language.endswith("-head"):
-            language = language[:-5]
-            log.debug("Language had suffix '-head', removing. Result: {}".format(language))
+        language = normalize_language(language)
 
         previous_entities = defaultdict(lambda: None)
         self._recurse(registry, random, language, document_plan, previous_entities, set())
@@ -86,7 +84,7 @@ class EntityNameResolver(NLGPipelineComponent):
 
             return encountered, previous_entities
         elif isinstance(this, DocumentPlanNode):
-            log.debug("Visiting non-leaf '{}'".format(this))
+            log.debug("Visiting non-leaf '%s'", this)
             for child in this.children:
                 encountered, previous_entities = self._recurse(
                     registry, random, language, child, previous_entities, encountered
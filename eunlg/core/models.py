@@ -7,6 +7,13 @@ from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 
 log = logging.getLogger(__name__)
 
+# Integer tags identifying the kind of a node in a document plan. Hot tree traversals dispatch on the KIND class
+# attribute instead of doing isinstance() checks against the class hierarchy.
+PLAN_NODE_KIND = 0
+MESSAGE_KIND = 1
+SLOT_KIND = 2
+COMPONENT_KIND = 3
+
 
 class Document(object):
     def __init__(self, language: str, document_plan: Optional["DocumentPlanNode"] = None):
@@ -41,6 +48,8 @@ class DocumentPlanNode(object):
     A Node in the document plan. Has an ordered list of children, collectively connected by a Relation.
     """
 
+    KIND = PLAN_NODE_KIND
+
     def __init__(
         self, children: Optional[List["DocumentPlanNode"]] = None, relation: Relation = Relation.SEQUENCE
     ) -> None:
@@ -133,6 +142,8 @@ class Message(DocumentPlanNode):
 
     """
 
+    KIND = MESSAGE_KIND
+
     def __init__(
         self,
         facts: Union[List["Fact"], "Fact"],
@@ -375,6 +386,8 @@ class DefaultTemplate(Template):
 class TemplateComponent(object):
     """An abstract TemplateComponent. Should not be used directly."""
 
+    KIND = COMPONENT_KIND
+
     def __init__(self) -> None:
         self._parent = None
 
@@ -407,6 +420,8 @@ class Slot(TemplateComponent):
     requirements.
     """
 
+    KIND = SLOT_KIND
+
     # Todo: Are the values in "attributes" of a known type?
     def __init__(
         self,
@@ -449,6 +464,24 @@ class Slot(TemplateComponent):
         return "Slot({}{})".format(value, "".join(", {}={}".format(k, v) for (k, v) in self.attributes.items()))
 
 
+class RealizedValue(object):
+    """
+    A callable that ignores the Fact and returns a precomputed value. Assigned as the value function of Slots whose
+    final value has already been realized. Cheaper than a new lambda for each Slot, as there is no closure involved.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Union[str, int, float]) -> None:
+        self.value = value
+
+    def __call__(self, fact: Optional[Fact] = None) -> Union[str, int, float]:
+        return self.value
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+
 class LiteralSlot(Slot):
     def __init__(self, value: str, attributes: Optional[Dict[str, str]] = None) -> None:
         super().__init__(LiteralSource(value), attributes)
@@ -1,24 +1,43 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple
+from typing import Dict, FrozenSet, List, Sequence, Tuple
 
 from numpy.random import Generator
 
-from .models import DocumentPlanNode, Message, Slot, TemplateComponent
-from .pipeline import NLGPipelineComponent
+from .models import MESSAGE_KIND, SLOT_KIND, DocumentPlanNode, Message, RealizedValue, Slot, TemplateComponent
+from .pipeline import NLGPipelineComponent, normalize_language
 from .registry import Registry
 
 log = logging.getLogger(__name__)
 
 
 class LanguageSpecificMorphologicalRealizer(ABC):
+    # Realizers that never look at the left or right context can set this to False, in which case the
+    # MorphologicalRealizer realizes all slots of the document plan with a single call to realize_batch.
+    uses_context: bool = True
+
+    # The slot attributes the realizer acts on. Slots with none of these are left as-is without calling realize().
+    morphological_attributes: FrozenSet[str] = frozenset({"case", "gendered"})
+
     def __init__(self, language):
         self.language = language
 
     @abstractmethod
-    def realize(self, slot: Slot, left_context: List[TemplateComponent], right_context: List[TemplateComponent]) -> str:
+    def realize(self, slot: Slot, components: Sequence[TemplateComponent], idx: int) -> str:
+        """
+        Realizes the slot, which is found at index `idx` of the template `components`. The left context of the slot
+        is thus `components[:idx]` and the right context `components[idx + 1:]`. These are not sliced up front, as
+        most realizers never look at them, and the ones that do rarely need more than a word or two.
+        """
         pass
 
+    def realize_batch(self, slots: List[Slot]) -> List[str]:
+        """
+        Realizes all of the slots at once, returning the realized values in the same order. Only used for realizers
+        that do not use context, so no context is passed on to realize().
+        """
+        return [self.realize(slot, (), 0) for slot in slots]
+
 
 class MorphologicalRealizer(NLGPipelineComponent):
     def __init__(self, language_realizers: Dict[str, LanguageSpecificMorphologicalRealizer]) -> None:
@@ -32,33 +51,63 @@ class MorphologicalRealizer(NLGPipelineComponent):
         """
         log.info("Running Morphological Realizer")
 
-        if language.endswith("-head"):
-            language = language[:-5]
-            log.debug("Language had suffix '-head', removing. Result: {}".format(language))
+        language = normalize_language(language)
 
         if language not in self.language_realizers:
             log.warning("No morphological realizer for language {}".format(language))
             return (document_plan,)
 
-        self._recurse(language, document_plan)
+        self._traverse(self.language_realizers[language], document_plan)
 
         if log.isEnabledFor(logging.DEBUG):
             document_plan.print_tree()
 
         return (document_plan,)
 
-    def _recurse(self, language: str, this: DocumentPlanNode) -> None:
-        log.debug("Visiting '{}'".format(this))
-        if not isinstance(this, Message):
-            for child in this.children:
-                self._recurse(language, child)
+    def _traverse(self, realizer: LanguageSpecificMorphologicalRealizer, document_plan: DocumentPlanNode) -> None:
+        """
+        Walks the DocumentPlan tree in pre-order using an explicit stack and realizes the slots of every Message.
+        """
+        realize_message = self.realize_message
+        debug = log.isEnabledFor(logging.DEBUG)
+
+        batch: List[Slot] = []
+        stack: List[DocumentPlanNode] = [document_plan]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            this = pop()
+            if debug:
+                log.debug("Visiting '%s'", this)
+            if this.KIND != MESSAGE_KIND:
+                extend(reversed(this.children))
+                continue
+            realize_message(realizer, this, batch)
+
+        self.realize_batch(realizer, batch)
+
+    @staticmethod
+    def realize_message(realizer: LanguageSpecificMorphologicalRealizer, message: Message, batch: List[Slot]) -> None:
+        """
+        Realizes the slots of the Message one at a time if the realizer uses context, as the later slots should then
+        see the already realized values of the earlier ones. Otherwise the slots are only appended to `batch`, to be
+        realized all at once by realize_batch().
+        """
+        components = message.template.components
+        skip = realizer.morphological_attributes.isdisjoint
+        if not realizer.uses_context:
+            batch.extend(
+                component for component in components if component.KIND == SLOT_KIND and not skip(component.attributes)
+            )
             return
 
-        for idx, template_component in enumerate(this.template.components):
-            if isinstance(template_component, Slot):
-                left_context = this.template.components[:idx]
-                right_context = this.template.components[idx + 1 :]
-                realized_value = self.language_realizers[language].realize(
-                    template_component, left_context, right_context
-                )
-                template_component.value = lambda x, realized_value=realized_value: realized_value
+        realize = realizer.realize
+        for idx, template_component in enumerate(components):
+            if template_component.KIND == SLOT_KIND and not skip(template_component.attributes):
+                template_component.value = RealizedValue(realize(template_component, components, idx))
+
+    @staticmethod
+    def realize_batch(realizer: LanguageSpecificMorphologicalRealizer, batch: List[Slot]) -> None:
+        if batch:
+            for slot, realized_value in zip(batch, realizer.realize_batch(batch)):
+                slot.value = RealizedValue(realized_value)
@@ -1,5 +1,6 @@
 import logging
 from abc import ABC
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from numpy import random
@@ -10,6 +11,14 @@ from .registry import Registry
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def normalize_language(language: str) -> str:
+    """
+    Strips the "-head" suffix used to mark headline generation from a language code.
+    """
+    return language[:-5] if language.endswith("-head") else language
+
+
 class NLGPipelineComponent(ABC):
 
     # TODO: We'd want this to be along the lines of "run(self, registry: Registry, ..., *args: Any) but that's not
@@ -41,7 +50,7 @@ class LanguageSplitComponent(NLGPipelineComponent):
         See e.g. https://github.com/python/mypy/issues/5876 for discussion.
         """
 
-        lookup_language = language[:-5] if language.endswith("-head") else language
+        lookup_language = normalize_language(language)
         if lookup_language not in self.subcomponents:
             raise Exception(
                 "Attempted to access subcomponent for unknown language {} (formatted as {})".format(
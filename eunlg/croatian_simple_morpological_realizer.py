@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, List
+from typing import Optional, Sequence
 
 from core.models import Slot, TemplateComponent
 from core.morphological_realizer import LanguageSpecificMorphologicalRealizer
@@ -10,27 +10,32 @@ VOWELS = "aeiouyAEIOUY"
 
 
 class CroatianSimpleMorphologicalRealizer(LanguageSpecificMorphologicalRealizer):
+    uses_context = False
+    morphological_attributes = frozenset({"case"})
+
     def __init__(self):
         super().__init__("hr")
 
-    def realize(self, slot: Slot, left_context: List[TemplateComponent], right_context: List[TemplateComponent]) -> str:
+    def realize(self, slot: Slot, components: Sequence[TemplateComponent], idx: int) -> str:
         case: Optional[str] = slot.attributes.get("case")
         if case is None:
             return slot.value
 
-        log.debug("Realizing {} to Croatian".format(slot.value))
+        value = slot.value
+
+        log.debug("Realizing %s to Croatian", value)
 
         if case == "loc":
             log.debug('Has case "loc", this we can handle.')
-            if slot.value[-1] in VOWELS:
-                if slot.value[-2] == "j":
-                    new_value = slot.value[:-1] + "i"
+            if value[-1] in VOWELS:
+                if value[-2] == "j":
+                    new_value = value[:-1] + "i"
                 else:
-                    new_value = slot.value[:-1] + "oj"
+                    new_value = value[:-1] + "oj"
             else:
-                new_value = slot.value + "u"
-            log.debug("Realized as {}".format(new_value))
+                new_value = value + "u"
+            log.debug("Realized as %s", new_value)
             return new_value
 
         log.debug("Had either no case or somehing weird, just ignore")
-        return slot.value
+        return value
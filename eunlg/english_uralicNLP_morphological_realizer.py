@@ -1,54 +1,64 @@
 import logging
-from typing import Dict, Optional, List
-
-from uralicNLP import uralicApi
+from typing import Dict, Optional, Sequence
 
 from core.models import Slot, TemplateComponent
 from core.morphological_realizer import LanguageSpecificMorphologicalRealizer
+from uralicNLP_lookup_cache import LOOKUP_CACHE, ensure_uralic_models
 
 log = logging.getLogger(__name__)
 
 
-if not uralicApi.is_language_installed("eng"):
-    uralicApi.download("eng")
-
-
 class EnglishUralicNLPMorphologicalRealizer(LanguageSpecificMorphologicalRealizer):
+    uses_context = False
+    morphological_attributes = frozenset({"case"})
+
     def __init__(self):
+        ensure_uralic_models("eng")
         super().__init__("en")
 
         self.case_map: Dict[str, str] = {"genitive": "GEN"}
 
-    def realize(self, slot: Slot, left_context: List[TemplateComponent], right_context: List[TemplateComponent]) -> str:
+    def realize(self, slot: Slot, components: Sequence[TemplateComponent], idx: int) -> str:
         case: Optional[str] = slot.attributes.get("case")
         if case is None:
             return slot.value
 
-        log.debug("Realizing {} to English".format(slot.value))
+        return self._realize(slot.value, case)
 
+    def _realize(self, value: str, case: str) -> str:
+        log.debug("Realizing %s to English", value)
+
+        original_case = case
         case = self.case_map.get(case.lower(), case.upper())
-        log.debug("Normalized case {} to {}".format(slot.attributes.get("case"), case))
+        log.debug("Normalized case %s to %s", original_case, case)
+
+        # English genitives are regular enough that there is no need to go through the FST: a plain apostrophe is
+        # added to words ending in "s" (e.g. "countries'"), and "'s" to everything else.
+        if case == "GEN" and isinstance(value, str):
+            modified_value = value + "'" if value.endswith("s") else value + "'s"
+            log.debug("Realized value is %s", modified_value)
+            return modified_value
 
-        possible_analyses = uralicApi.analyze(slot.value, "eng")
-        log.debug("Identified {} possible analyses".format(len(possible_analyses)))
+        possible_analyses = LOOKUP_CACHE.analyze(value, "eng")
+        log.debug("Identified %s possible analyses", len(possible_analyses))
         if len(possible_analyses) == 0:
             log.warning(
-                "No valid morphological analysis for {}, unable to realize despite case attribute".format(slot.value)
+                "No valid morphological analysis for {}, unable to realize despite case attribute".format(value)
             )
-            return slot.value
+            return value
 
         analysis = possible_analyses[0][0]
-        log.debug("Picked {} as the morphological analysis of {}".format(analysis, slot.value))
+        log.debug("Picked %s as the morphological analysis of %s", analysis, value)
 
         analysis = "{}+{}".format(analysis, case)
-        log.debug("Modified analysis to {}".format(analysis))
+        log.debug("Modified analysis to %s", analysis)
 
-        generations = uralicApi.generate(analysis, "eng")
+        generations = LOOKUP_CACHE.generate(analysis, "eng")
         if not generations:
             log.warning(f"Could not generate surface form for {analysis}")
-            return slot.value
+            return value
 
         modified_value = generations[0][0]
-        log.debug("Realized value is {}".format(modified_value))
+        log.debug("Realized value is %s", modified_value)
 
         return modified_value
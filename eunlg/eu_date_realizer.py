@@ -5,7 +5,7 @@ from typing import Dict, List, Optional, Tuple, Union
 from numpy.random import Generator
 
 from core.models import DocumentPlanNode, Slot
-from core.pipeline import NLGPipelineComponent
+from core.pipeline import NLGPipelineComponent, normalize_language
 from core.registry import Registry
 
 log = logging.getLogger(__name__)
@@ -28,9 +28,7 @@ class EUDateRealizer(NLGPipelineComponent):
         """
         log.info("Realizing dates")
 
-        if language.endswith("-head"):
-            language = language[:-5]
-            log.debug("Language had suffix '-head', removing. Result: {}".format(language))
+        language = normalize_language(language)
 
         self._recurse(registry, random, language, document_plan, None)
 
@@ -104,7 +102,7 @@ class EUDateRealizer(NLGPipelineComponent):
                 log.debug("Visited TIME leaf node {} and realized it as {}".format(original_value, new_value))
                 previous_entity = original_value
             elif isinstance(child, DocumentPlanNode):
-                log.debug("Visiting non-leaf '{}'".format(child))
+                log.debug("Visiting non-leaf '%s'", child)
                 previous_entity = self._recurse(registry, random, language, child, previous_entity)
                 idx += 1
             else:
@@ -0,0 +1,72 @@
+import logging
+from typing import List, Tuple
+
+from numpy.random import Generator
+
+from core.models import MESSAGE_KIND, SLOT_KIND, DocumentPlanNode, Slot
+from core.morphological_realizer import MorphologicalRealizer
+from core.pipeline import NLGPipelineComponent, normalize_language
+from core.registry import Registry
+from eu_number_realizer import EUNumberRealizer
+
+log = logging.getLogger(__name__)
+
+
+class EUNumberAndMorphologicalRealizer(NLGPipelineComponent):
+    """
+    A NLGPipelineComponent that does the work of an EUNumberRealizer followed by a MorphologicalRealizer in a single
+    traversal of the DocumentPlan tree, rather than walking the tree once in each component.
+    """
+
+    def __init__(self, number_realizer: EUNumberRealizer, morphological_realizer: MorphologicalRealizer) -> None:
+        self.number_realizer = number_realizer
+        self.morphological_realizer = morphological_realizer
+
+    def run(
+        self, registry: Registry, random: Generator, language: str, document_plan: DocumentPlanNode
+    ) -> Tuple[DocumentPlanNode]:
+        """
+        Run this pipeline component.
+        """
+        log.info("Realizing numbers and morphology")
+
+        language = normalize_language(language)
+
+        ordinal_table = self.number_realizer.ordinal_table(language)
+        morphological_realizer = self.morphological_realizer.language_realizers.get(language)
+        if morphological_realizer is None:
+            log.warning("No morphological realizer for language {}".format(language))
+
+        # The walk below is the hot loop of the component, so everything it needs is bound to locals up front to
+        # save on repeated attribute lookups.
+        realize_slot = self.number_realizer.realize_slot
+        realize_message = self.morphological_realizer.realize_message
+        debug = log.isEnabledFor(logging.DEBUG)
+
+        batch: List[Slot] = []
+        stack: List[DocumentPlanNode] = [document_plan]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            this = pop()
+            if debug:
+                log.debug("Visiting '%s'", this)
+            if this.KIND != MESSAGE_KIND:
+                extend(reversed(this.children))
+                continue
+
+            # All numbers in the Message are realized before any morphology, so that realizers using context see the
+            # same values as they would when the two components are run one after the other.
+            for component in this.template.components:
+                if component.KIND == SLOT_KIND:
+                    realize_slot(ordinal_table, component)
+            if morphological_realizer is not None:
+                realize_message(morphological_realizer, this, batch)
+
+        if morphological_realizer is not None:
+            self.morphological_realizer.realize_batch(morphological_realizer, batch)
+
+        if log.isEnabledFor(logging.DEBUG):
+            document_plan.print_tree()
+
+        return (document_plan,)
@@ -1,12 +1,12 @@
 import logging
-from abc import ABC, abstractmethod
-from numbers import Number
-from typing import Dict, Tuple, Union, cast
+from numbers import Integral, Number
+from types import MappingProxyType
+from typing import Callable, List, Mapping, NamedTuple, Optional, Tuple, Union
 
 from numpy.random import Generator
 
-from core.models import DocumentPlanNode, Slot
-from core.pipeline import NLGPipelineComponent
+from core.models import MESSAGE_KIND, PLAN_NODE_KIND, SLOT_KIND, DocumentPlanNode, RealizedValue, Slot
+from core.pipeline import NLGPipelineComponent, normalize_language
 from core.registry import Registry
 
 log = logging.getLogger(__name__)
@@ -18,15 +18,8 @@ class EUNumberRealizer(NLGPipelineComponent):
     """
 
     def __init__(self):
-        self.realizers = {
-            "fi": {"car": FinnishCardinalRealizer(), "ord": FinnishOrdinalRealizer()},
-            "en": {"car": EnglishCardinalRealizer(), "ord": EnglishOrdinalRealizer()},
-            "hr": {"ord": CroatianOrdinalRealizer()},
-            "de": {"car": GermanCardinalRealizer()},
-            "ru": {"ord": RussianOrdinalRealizer()},
-            "ee": {"car": EstonianCardinalRealizer(), "ord": EstonianOrdinalRealizer()},
-            "sl": {"car": SlovenianCardinalRealizer(), "ord": SlovenianOrdinalRealizer()},
-        }
+        # The tables are read-only, so all instances share the same ones rather than building their own
+        self.realizers: Mapping[Tuple[str, str], NumberTable] = NUMBER_TABLES
 
     def run(
         self, registry: Registry, random: Generator, language: str, document_plan: DocumentPlanNode
@@ -36,75 +29,131 @@ class EUNumberRealizer(NLGPipelineComponent):
         """
         log.info("Realizing dates")
 
-        if language.endswith("-head"):
-            language = language[:-5]
-            log.debug("Language had suffix '-head', removing. Result: {}".format(language))
+        language = normalize_language(language)
 
-        self._recurse(registry, random, language, document_plan)
+        self._traverse(self.ordinal_table(language), document_plan)
 
         if log.isEnabledFor(logging.DEBUG):
             document_plan.print_tree()
 
         return (document_plan,)
 
-    def _recurse(
-        self, registry: Registry, random: Generator, language: str, this: DocumentPlanNode,
-    ):
+    def ordinal_table(self, language: str) -> Optional["NumberTable"]:
+        return self.realizers.get((language, "ord"))
+
+    def _traverse(self, ordinal_table: Optional["NumberTable"], document_plan: DocumentPlanNode) -> None:
+        """
+        Traverses the DocumentPlan tree in pre-order using an explicit stack and replaces the to_value functions of
+        ordinal slots with ones returning the realized form of the number.
         """
-        Traverses the DocumentPlan tree recursively in-order and modifies named
-        entity to_value functions to return the chosen form of that NE's name.
+        realize_slot = self.realize_slot
+        debug = log.isEnabledFor(logging.DEBUG)
+
+        stack: List[DocumentPlanNode] = [document_plan]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            this = pop()
+            kind = this.KIND
+            if kind == SLOT_KIND:
+                realize_slot(ordinal_table, this)
+            elif kind == PLAN_NODE_KIND or kind == MESSAGE_KIND:
+                if debug:
+                    log.debug("Visiting non-leaf '%s'", this)
+                extend(reversed(this.children))
+
+    @staticmethod
+    def realize_slot(ordinal_table: Optional["NumberTable"], slot: Slot) -> None:
         """
-        language_specific_realizers = self.realizers.get(language, {})
-        if isinstance(this, Slot):
-            this = cast(Slot, this)
-            if this.attributes and this.attributes.get("ord"):
-                realizer = language_specific_realizers.get("ord")
-                if not realizer:
-                    log.error("Wanted to realize as ordinal '{}' but found no realizer.".format(this.value))
+        Replaces the to_value function of the Slot with one returning the realized form of the number, if the Slot is
+        to be realized as an ordinal.
+        """
+        if slot.attributes and slot.attributes.get("ord"):
+            if ordinal_table is None:
+                log.error("Wanted to realize as ordinal '{}' but found no realizer.".format(slot.value))
+            else:
+                value = slot.value
+                # Slot values are nearly always ints, which can be looked up without converting them to strings
+                if type(value) is int:
+                    new_value = ordinal_table.numerals.get(value)
                 else:
-                    new_value = realizer.realize(this)
-                    this.value = lambda x: new_value
+                    new_value = ordinal_table.words.get(value)
+                if new_value is None:
+                    new_value = ordinal_table.fallback(value)
+                slot.value = RealizedValue(new_value)
 
-        elif isinstance(this, DocumentPlanNode):
-            log.debug("Visiting non-leaf '{}'".format(this))
-            for child in this.children:
-                self._recurse(registry, random, language, child)
 
+class NumberTable(NamedTuple):
+    """
+    Realizations of numbers, looked up in `numerals` for int values and in `words` for any other values, with
+    `fallback` producing the realization of any number found in neither.
+    """
 
-class Realizer(ABC):
-    @abstractmethod
-    def realize(self, slot) -> str:
-        """ Implemented in a subclass. """
+    numerals: Mapping[int, str]
+    words: Mapping[str, str]
+    fallback: Callable[[Union[Number, str]], str]
 
 
-class DictionaryRealizer(Realizer):
-    def __init__(self, dictionary: Dict[str, str]):
-        self.dictionary = dictionary
+def _as_int(value: Union[Number, str]) -> Optional[int]:
+    """
+    Returns the value as an int if it is an integer or the string form of one, None otherwise. Floats are never
+    converted, so e.g. 3.0 is realized as "3.0th" rather than "3.0rd".
+    """
+    if isinstance(value, Integral):
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return None
+    return None
 
-    def realize(self, slot: Slot) -> str:
-        return self.dictionary.get(str(slot.value), str(slot.value))
 
+# Indexed by the last digit, plus 10 for numbers whose second to last digit is 1. The latter are always "th", as 11,
+# 12 and 13 (as well as 111 etc.) are exceptions to the last digit rule.
+_ENGLISH_ORDINAL_SUFFIXES = ("th", "st", "nd", "rd", "th", "th", "th", "th", "th", "th") + ("th",) * 10
 
-class FinnishCardinalRealizer(DictionaryRealizer):
-    def __init__(self):
-        super(FinnishCardinalRealizer, self).__init__(
-            {
-                "1": "yksi",
-                "2": "kaksi",
-                "3": "kolme",
-                "4": "neljä",
-                "5": "viisi",
-                "6": "kuusi",
-                "7": "seitsemän",
-                "8": "kahdeksan",
-                "9": "yhdeksän",
-                "10": "kymmenen",
-            }
-        )
-
-
-class FinnishOrdinalRealizer(Realizer):
-    SMALL_ORDINALS: Dict[str, str] = {
+
+def _english_ordinal_suffix(value: Union[Number, str]) -> str:
+    n = _as_int(value)
+    if n is None:
+        return "th"
+    n = abs(n)
+    return _ENGLISH_ORDINAL_SUFFIXES[n % 10 + 10 * (n % 100 // 10 == 1)]
+
+
+def _with_english_suffix(value: Union[Number, str]) -> str:
+    return "{}{}".format(value, _english_ordinal_suffix(value))
+
+
+def _int_keyed(table: Mapping[str, str]) -> Mapping[int, str]:
+    return MappingProxyType({int(key): value for key, value in table.items()})
+
+
+def _with_period(value: Union[Number, str]) -> str:
+    return "{}.".format(value)
+
+
+_NO_NUMERALS: Mapping[int, str] = MappingProxyType({})
+_NO_WORDS: Mapping[str, str] = MappingProxyType({})
+
+FINNISH_CARDINALS: Mapping[str, str] = MappingProxyType(
+    {
+        "1": "yksi",
+        "2": "kaksi",
+        "3": "kolme",
+        "4": "neljä",
+        "5": "viisi",
+        "6": "kuusi",
+        "7": "seitsemän",
+        "8": "kahdeksan",
+        "9": "yhdeksän",
+        "10": "kymmenen",
+    }
+)
+
+FINNISH_ORDINALS: Mapping[str, str] = MappingProxyType(
+    {
         "1": "ensimmäinen",
         "2": "toinen",
         "3": "kolmas",
@@ -116,31 +165,42 @@ class FinnishOrdinalRealizer(Realizer):
         "9": "yhdeksäs",
         "10": "kymmenes",
     }
+)
+
+ENGLISH_CARDINALS: Mapping[str, str] = MappingProxyType(
+    {
+        "1": "one",
+        "2": "two",
+        "3": "three",
+        "4": "four",
+        "5": "five",
+        "6": "six",
+        "7": "seven",
+        "8": "eight",
+        "9": "nine",
+        "10": "ten",
+    }
+)
+
+GERMAN_CARDINALS: Mapping[str, str] = MappingProxyType(
+    {
+        "1": "eins",
+        "2": "zwei",
+        "3": "drei",
+        "4": "vier",
+        "5": "fünf",
+        "6": "sechs",
+        "7": "sieben",
+        "8": "acht",
+        "9": "neun",
+        "10": "zehn",
+        "11": "elf",
+        "12": "zwölf",
+    }
+)
 
-    def realize(self, slot: Slot) -> str:
-        return self.SMALL_ORDINALS.get(slot.value, "{}.".format(slot.value))
-
-
-class EnglishCardinalRealizer(DictionaryRealizer):
-    def __init__(self):
-        super(EnglishCardinalRealizer, self).__init__(
-            {
-                "1": "one",
-                "2": "two",
-                "3": "three",
-                "4": "four",
-                "5": "five",
-                "6": "six",
-                "7": "seven",
-                "8": "eight",
-                "9": "nine",
-                "10": "ten",
-            }
-        )
-
-
-class EnglishOrdinalRealizer(Realizer):
-    SMALL_ORDINALS: Dict[str, str] = {
+ENGLISH_ORDINALS: Mapping[str, str] = MappingProxyType(
+    {
         "1": "first",
         "2": "second",
         "3": "third",
@@ -154,97 +214,40 @@ class EnglishOrdinalRealizer(Realizer):
         "11": "eleventh",
         "12": "twelfth",
     }
+)
+
+ESTONIAN_CARDINALS: Mapping[str, str] = MappingProxyType(
+    {
+        "1": "üks",
+        "2": "kaks",
+        "3": "kolm",
+        "4": "neli",
+        "5": "viis",
+        "6": "kuus",
+        "7": "seitse",
+        "8": "kaheksa",
+        "9": "üheksa",
+        "10": "kümme",
+    }
+)
+
+SLOVENIAN_CARDINALS: Mapping[str, str] = MappingProxyType(
+    {
+        "1": "ena",
+        "2": "dva",
+        "3": "tri",
+        "4": "štiri",
+        "5": "pet",
+        "6": "šest",
+        "7": "sedem",
+        "8": "osem",
+        "9": "devet",
+        "10": "deset",
+    }
+)
 
-    def _get_suffix(self, value: Union[Number, str]) -> str:
-        if value in [11, 12, 13]:
-            return "th"
-        elif str(value)[-1] == "1":
-            return "st"
-        elif str(value)[-1] == "2":
-            return "nd"
-        elif str(value)[-1] == "3":
-            return "rd"
-        else:
-            return "th"
-
-    def realize(self, slot: Slot) -> str:
-        if str(slot.value) == "1":
-            # Rather than saying "1st highest", it's sufficient to simply say "highest"
-            return ""
-        return self.SMALL_ORDINALS.get(slot.value, "{}{}".format(slot.value, self._get_suffix(slot.value)))
-
-
-class GermanCardinalRealizer(DictionaryRealizer):
-    def __init__(self):
-        super(GermanCardinalRealizer, self).__init__(
-            {
-                "1": "eins",
-                "2": "zwei",
-                "3": "drei",
-                "4": "vier",
-                "5": "fünf",
-                "6": "sechs",
-                "7": "sieben",
-                "8": "acht",
-                "9": "neun",
-                "10": "zehn",
-                "11": "elf",
-                "12": "zwölf",
-            }
-        )
-
-
-class CroatianOrdinalRealizer(Realizer):
-    def realize(self, slot: Slot) -> str:
-        return "{}.".format(slot.value)
-
-
-class RussianOrdinalRealizer(Realizer):
-    def realize(self, slot: Slot) -> str:
-        if str(slot.value) == "1":
-            # Rather than saying "1st highest" in Russian, it's sufficient to simply say "highest"
-            return ""
-        return "{}".format(slot.value)
-
-
-class EstonianCardinalRealizer(DictionaryRealizer):
-    def __init__(self):
-        super(EstonianCardinalRealizer, self).__init__(
-            {
-                "1": "üks",
-                "2": "kaks",
-                "3": "kolm",
-                "4": "neli",
-                "5": "viis",
-                "6": "kuus",
-                "7": "seitse",
-                "8": "kaheksa",
-                "9": "üheksa",
-                "10": "kümme",
-            }
-        )
-
-
-class SlovenianCardinalRealizer(DictionaryRealizer):
-    def __init__(self):
-        super(SlovenianCardinalRealizer, self).__init__(
-            {
-                "1": "ena",
-                "2": "dva",
-                "3": "tri",
-                "4": "štiri",
-                "5": "pet",
-                "6": "šest",
-                "7": "sedem",
-                "8": "osem",
-                "9": "devet",
-                "10": "deset",
-            }
-        )
-
-
-class EstonianOrdinalRealizer(Realizer):
-    SMALL_ORDINALS: Dict[str, str] = {
+ESTONIAN_ORDINALS: Mapping[str, str] = MappingProxyType(
+    {
         "1": "esimene",
         "2": "teine",
         "3": "kolmas",
@@ -256,29 +259,25 @@ class EstonianOrdinalRealizer(Realizer):
         "9": "üheksas",
         "10": "kümnes",
     }
-
-    def realize(self, slot: Slot) -> str:
-        return self.SMALL_ORDINALS.get(slot.value, "{}.".format(slot.value))
-
-
-class SlovenianOrdinalRealizer(Realizer):
-    SMALL_ORDINALS: Dict[str, str] = {
-        "1": "prvi",
-        "2": "drugi",
-        "3": "tretji",
-        "4": "četrti",
-        "5": "peti",
-        "6": "šesti",
-        "7": "sedmi",
-        "8": "osmi",
-        "9": "deveti",
-        "10": "deseti",
-        "11": "enajsti",
-        "12": "dvanajsti",
+)
+
+# Rather than saying "1st highest", it's sufficient to simply say "highest". Used for English, Russian and (?) Slovenian
+OMIT_FIRST: Mapping[str, str] = MappingProxyType({"1": ""})
+
+NUMBER_TABLES: Mapping[Tuple[str, str], NumberTable] = MappingProxyType(
+    {
+        ("fi", "car"): NumberTable(_int_keyed(FINNISH_CARDINALS), FINNISH_CARDINALS, str),
+        ("fi", "ord"): NumberTable(_NO_NUMERALS, FINNISH_ORDINALS, _with_period),
+        ("en", "car"): NumberTable(_int_keyed(ENGLISH_CARDINALS), ENGLISH_CARDINALS, str),
+        ("en", "ord"): NumberTable(
+            _int_keyed(OMIT_FIRST), MappingProxyType({**ENGLISH_ORDINALS, **OMIT_FIRST}), _with_english_suffix
+        ),
+        ("hr", "ord"): NumberTable(_NO_NUMERALS, _NO_WORDS, _with_period),
+        ("de", "car"): NumberTable(_int_keyed(GERMAN_CARDINALS), GERMAN_CARDINALS, str),
+        ("ru", "ord"): NumberTable(_int_keyed(OMIT_FIRST), OMIT_FIRST, str),
+        ("ee", "car"): NumberTable(_int_keyed(ESTONIAN_CARDINALS), ESTONIAN_CARDINALS, str),
+        ("ee", "ord"): NumberTable(_NO_NUMERALS, ESTONIAN_ORDINALS, _with_period),
+        ("sl", "car"): NumberTable(_int_keyed(SLOVENIAN_CARDINALS), SLOVENIAN_CARDINALS, str),
+        ("sl", "ord"): NumberTable(_int_keyed(OMIT_FIRST), OMIT_FIRST, _with_period),
     }
-
-    def realize(self, slot: Slot) -> str:
-        if str(slot.value) == "1":
-            # Rather than saying "1st highest" in Slovenian, it's sufficient to simply say "highest" (?)
-            return ""
-        return "{}.".format(slot.value)
+)
@@ -1,49 +1,52 @@
 import logging
-from typing import Dict, Optional, List
-
-from uralicNLP import uralicApi
+from typing import Dict, Optional, Sequence
 
 from core.models import Slot, TemplateComponent
 from core.morphological_realizer import LanguageSpecificMorphologicalRealizer
+from uralicNLP_lookup_cache import LOOKUP_CACHE, ensure_uralic_models
 
 log = logging.getLogger(__name__)
 
-if not uralicApi.is_language_installed("fin"):
-    uralicApi.download("fin")
-
 
 class FinnishUralicNLPMorphologicalRealizer(LanguageSpecificMorphologicalRealizer):
+    uses_context = False
+    morphological_attributes = frozenset({"case"})
+
     def __init__(self):
+        ensure_uralic_models("fin")
         super().__init__("fi")
 
         self.case_map: Dict[str, str] = {"ssa": "Ine", "ssä": "Ine", "inessive": "Ine", "genitive": "Gen"}
 
-    def realize(self, slot: Slot, left_context: List[TemplateComponent], right_context: List[TemplateComponent]) -> str:
+    def realize(self, slot: Slot, components: Sequence[TemplateComponent], idx: int) -> str:
         case: Optional[str] = slot.attributes.get("case")
         if case is None:
             return slot.value
 
-        log.debug("Realizing {} to Finnish".format(slot.value))
+        value = slot.value
 
+        log.debug("Realizing %s to Finnish", value)
+
+        original_case = case
         case = self.case_map.get(case.lower(), case.capitalize())
-        log.debug("Normalized case {} to {}".format(slot.attributes.get("case"), case))
+        log.debug("Normalized case %s to %s", original_case, case)
 
         possible_analyses = [
             analysis[0]
-            for analysis in uralicApi.analyze(slot.value, "fin")
+            for analysis in LOOKUP_CACHE.analyze(value, "fin")
             if "Nom" in analysis[0] and "Sg" in analysis[0]
         ]
-        log.debug("Identified {} possible analyses".format(len(possible_analyses)))
+        log.debug("Identified %s possible analyses", len(possible_analyses))
         for analysis in possible_analyses:
-            log.debug("\t{}".format(analysis))
+            log.debug("\t%s", analysis)
         if len(possible_analyses) == 0:
             log.warning(
-                "No valid morphological analysis for {}, unable to realize despite case attribute".format(slot.value)
+                "No valid morphological analysis for {}, unable to realize despite case attribute".format(value)
             )
-            return slot.value
+            return value
 
         analysis = possible_analyses[0]
-        log.debug("Picked {} as the morphological analysis of {}".format(analysis, slot.value))
+        log.debug("Picked %s as the morphological analysis of %s", analysis, value)
 
         # We only want to replace the last occurence of "Nom", as otherwise all parts of compound words, rather than
         # only the last, get transformed to genitive. This is simply wrong for, e.g. "tyvipari". Simply doing a global
@@ -52,14 +55,14 @@ class FinnishUralicNLPMorphologicalRealizer(LanguageSpecificMorphologicalRealize
         # fiddle with slices.
         gen_start_idx = analysis.rfind("Nom")
         analysis = analysis[:gen_start_idx] + case + analysis[gen_start_idx + 4 :]  # 4 = 1 + len("Nom")
-        log.debug("Modified analysis to {}".format(analysis))
+        log.debug("Modified analysis to %s", analysis)
 
-        generations = uralicApi.generate(analysis, "fin")
+        generations = LOOKUP_CACHE.generate(analysis, "fin")
         if not generations:
             log.warning(f"Could not generate surface form for {analysis}")
-            return slot.value
+            return value
 
         modified_value = generations[0][0]
-        log.debug("Realized value is {}".format(modified_value))
+        log.debug("Realized value is %s", modified_value)
 
         return modified_value
@@ -1,5 +1,5 @@
 import logging
-from typing import List, Optional
+from typing import Optional, Sequence
 
 from core.models import Slot, TemplateComponent
 from core.morphological_realizer import LanguageSpecificMorphologicalRealizer
@@ -14,11 +14,13 @@ class RussianMorphologicalRealizer(LanguageSpecificMorphologicalRealizer):
         super().__init__("ru")
         self.morph = pymorphy2.MorphAnalyzer()
 
-    def realize(self, slot: Slot, left_context: List[TemplateComponent], right_context: List[TemplateComponent]) -> str:
+    def realize(self, slot: Slot, components: Sequence[TemplateComponent], idx: int) -> str:
         gender: Optional[str] = slot.attributes.get("gendered")
         if gender is not None:
             if gender == "previous_word":
-                previous_word = left_context[-1]
+                if idx == 0:
+                    raise IndexError("Slot gendered by the previous word is the first component of its template")
+                previous_word = components[idx - 1]
                 analysis = self.morph.parse(previous_word.value)[0]
                 verb_analysis = self.morph.parse(slot.value)[0]
                 if "femn" in analysis.tag:
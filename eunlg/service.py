@@ -37,6 +37,7 @@ from eu_message_generator import EUMessageGenerator, NoMessagesForSelectionExcep
 from eu_named_entity_resolver import EUEntityNameResolver
 from eu_neural_sim_document_planner import EUNeuralSimBodyDocumentPlanner
 from eu_newsworthiness_only_document_planner import EUScoreHeadlineDocumentPlanner, EUScoreBodyDocumentPlanner
+from eu_number_and_morphological_realizer import EUNumberAndMorphologicalRealizer
 from eu_number_realizer import EUNumberRealizer
 from eu_random_document_planner import EURandomHeadlineDocumentPlanner, EURandomBodyDocumentPlanner
 from eu_topic_sim_document_planner import EUTopicSimHeadlineDocumentPlanner, EUTopicSimBodyDocumentPlanner
@@ -70,6 +71,7 @@ class EUNlgService:
         force_cache_refresh: bool = False,
         nomorphi: bool = False,
         planner: str = "full",
+        fuse_realizers: bool = True,
     ) -> None:
         """
         :param random_seed: seed for random number generation, for repeatability
@@ -77,6 +79,8 @@ class EUNlgService:
         :param nomorphi: don't load Omorphi for morphological generation. This removes the dependency on Omorphi,
             so allows easier setup, but means that no morphological inflection will be performed on the output,
             which is generally a very bad thing for the full pipeline
+        :param fuse_realizers: realize numbers and morphology in a single pass over the document plan, rather than
+            running the EUNumberRealizer and the MorphologicalRealizer as separate pipeline components
         """
 
         # New registry and result importer
@@ -171,8 +175,8 @@ class EUNlgService:
                 }
             )
             yield EUEntityNameResolver()
-            yield EUNumberRealizer()
-            yield MorphologicalRealizer(
+            number_realizer = EUNumberRealizer()
+            morphological_realizer = MorphologicalRealizer(
                 {
                     "en": EnglishUralicNLPMorphologicalRealizer(),
                     "fi": FinnishUralicNLPMorphologicalRealizer(),
@@ -182,6 +186,11 @@ class EUNlgService:
                     "sl": SlovenianSimpleMorphologicalRealizer(),
                 }
             )
+            if fuse_realizers:
+                yield EUNumberAndMorphologicalRealizer(number_realizer, morphological_realizer)
+            else:
+                yield number_realizer
+                yield morphological_realizer
             yield HeadlineHTMLSurfaceRealizer() if headline else BodyHTMLSurfaceRealizer()
 
         log.info("Configuring Body NLG Pipeline (planner = {})".format(planner))
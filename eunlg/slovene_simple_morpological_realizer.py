@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, List, Dict
+from typing import Optional, Sequence, Dict
 
 from core.models import Slot, TemplateComponent
 from core.morphological_realizer import LanguageSpecificMorphologicalRealizer
@@ -105,7 +105,7 @@ class SlovenianSimpleMorphologicalRealizer(LanguageSpecificMorphologicalRealizer
     def __init__(self):
         super().__init__("sl")
 
-    def realize(self, slot: Slot, left_context: List[TemplateComponent], right_context: List[TemplateComponent]) -> str:
+    def realize(self, slot: Slot, components: Sequence[TemplateComponent], idx: int) -> str:
         case: Optional[str] = slot.attributes.get("case")
         gendered: Optional[str] = slot.attributes.get("gendered")
 
@@ -124,8 +124,8 @@ class SlovenianSimpleMorphologicalRealizer(LanguageSpecificMorphologicalRealizer
 
         if gendered == "previous_word" and slot.value == "imela":
             log.debug(f"Found gendered word '{slot.value}'")
-            for left_slot in left_context[::-1]:
-                word = left_slot.value
+            for left_idx in range(idx - 1, -1, -1):
+                word = components[left_idx].value
                 log.debug(f"Checking word {word} to find the word that closest NP")
                 word = REV_LOC.get(word, word)  # Undo locative, if it was applied
                 if word in GENDER:
@@ -0,0 +1,118 @@
+import atexit
+import logging
+import os
+import pickle
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from uralicNLP import uralicApi
+
+log = logging.getLogger(__name__)
+
+CACHE_PATH = Path(__file__).parent.absolute() / ".." / "data" / "uralicNLP_lookups.cache"
+
+# The web service is stopped with SIGTERM, which skips atexit, so the cache is also saved after this many new lookups
+SAVE_INTERVAL = 1000
+
+
+@lru_cache(maxsize=None)
+def uralicnlp_version() -> str:
+    try:
+        import pkg_resources
+
+        return pkg_resources.get_distribution("uralicNLP").version
+    except Exception as ex:
+        log.warning("Failed to determine the uralicNLP version: {}".format(ex))
+        return "unknown"
+
+
+@lru_cache(maxsize=None)
+def ensure_uralic_models(language: str) -> None:
+    """
+    Downloads the uralicNLP models for `language` unless they are already installed. Only checks once per language
+    in each process.
+    """
+    if not uralicApi.is_language_installed(language):
+        uralicApi.download(language)
+
+
+class UralicNLPLookupCache:
+    """
+    Memoizes uralicNLP analyze() and generate() calls, and persists the results on disk so that later runs can skip the
+    FST entirely for words that have been seen before.
+
+    The cache is loaded lazily on the first lookup and written back after every `SAVE_INTERVAL` new lookups as well as
+    when the interpreter exits. Writing is done by merging with whatever is on disk at that point and atomically
+    replacing the file, so concurrently running workers never corrupt the file, but may occasionally lose each other's
+    most recent additions. The file records the uralicNLP version it was built with, and is ignored after an upgrade.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lookups: Optional[Dict[Tuple[str, str, str], List[Any]]] = None
+        self._unsaved = 0
+
+    def analyze(self, value: str, language: str) -> List[Any]:
+        return self._lookup("analyze", value, language)
+
+    def generate(self, value: str, language: str) -> List[Any]:
+        return self._lookup("generate", value, language)
+
+    def _lookup(self, function: str, value: str, language: str) -> List[Any]:
+        if self._lookups is None:
+            self._lookups = self._load()
+            atexit.register(self.save)
+
+        key = (function, language, value)
+        result = self._lookups.get(key)
+        if result is None:
+            result = getattr(uralicApi, function)(value, language)
+            self._lookups[key] = result
+            self._unsaved += 1
+            if self._unsaved % SAVE_INTERVAL == 0:
+                self.save()
+        return result
+
+    def _load(self) -> Dict[Tuple[str, str, str], List[Any]]:
+        if not self.path.exists():
+            log.info("No uralicNLP lookup cache at {}, starting from scratch".format(self.path))
+            return {}
+        try:
+            with open(self.path, "rb") as f:
+                version, lookups = pickle.load(f)
+            if version != uralicnlp_version():
+                log.info("Ignoring uralicNLP lookup cache from {}, built with uralicNLP {}".format(self.path, version))
+                return {}
+            log.info("Loaded {} uralicNLP lookups from {}".format(len(lookups), self.path))
+            return lookups
+        except Exception as ex:
+            log.warning("Failed to load uralicNLP lookup cache from {}, ignoring it: {}".format(self.path, ex))
+            return {}
+
+    def save(self) -> None:
+        if not self._unsaved:
+            return
+        lookups = self._load()
+        lookups.update(self._lookups)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.path.parent), prefix=self.path.name)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump((uralicnlp_version(), lookups), f)
+                # mkstemp() creates the file readable by its owner only
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, str(self.path))
+            except OSError:
+                os.remove(tmp_path)
+                raise
+        except OSError as ex:
+            log.warning("Failed to save uralicNLP lookup cache to {}: {}".format(self.path, ex))
+            return
+        self._unsaved = 0
+        log.info("Saved {} uralicNLP lookups to {}".format(len(lookups), self.path))
+
+
+LOOKUP_CACHE = UralicNLPLookupCache(CACHE_PATH)